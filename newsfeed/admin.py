@@ -1,6 +1,7 @@
 from django.contrib import admin, messages
 
 from .models import Issue, Newsletter, Post, PostCategory, Subscriber
+from newsfeed.utils.cache import invalidate_issue_list_cache
 from newsfeed.utils.send_newsletters import send_email_newsletter
 
 
@@ -22,13 +23,23 @@ class IssueAdmin(admin.ModelAdmin):
         'posts__title', 'posts__short_description',
     )
     readonly_fields = ('created_at', 'updated_at',)
-    sortable_by = ('issue_number', 'publish_date',)
+    sortable_by = ('issue_number', 'publish_date', 'is_published',)
     inlines = (PostInline,)
 
     actions = ('publish_issues', 'make_draft',)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_published_status()
+
+    def is_published(self, obj):
+        return obj.published
+
+    is_published.boolean = True
+    is_published.admin_order_field = 'published'
+
     def publish_issues(self, request, queryset):
         updated = queryset.update(is_draft=False)
+        invalidate_issue_list_cache()
         messages.add_message(
             request,
             messages.SUCCESS,
@@ -39,6 +50,7 @@ class IssueAdmin(admin.ModelAdmin):
 
     def make_draft(self, request, queryset):
         updated = queryset.update(is_draft=True)
+        invalidate_issue_list_cache()
         messages.add_message(
             request,
             messages.SUCCESS,
@@ -78,7 +90,6 @@ class NewsletterAdmin(admin.ModelAdmin):
 
 
 class PostAdmin(admin.ModelAdmin):
-    list_select_related = ('issue', 'category',)
     list_display = (
         'title', 'category',
         'issue', 'order', 'is_visible',
@@ -94,6 +105,9 @@ class PostAdmin(admin.ModelAdmin):
 
     actions = ('hide_post', 'make_post_visible',)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_relations()
+
     def hide_post(self, request, queryset):
         updated = queryset.update(is_visible=False)
         messages.add_message(
@@ -134,6 +148,28 @@ class SubscriberAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at',)
     exclude = ('token',)
 
+    actions = ('verify_subscribers', 'unsubscribe_subscribers',)
+
+    def verify_subscribers(self, request, queryset):
+        updated = queryset.bulk_verify()
+        messages.add_message(
+            request,
+            messages.SUCCESS,
+            f'Successfully verified {updated} subscriber(s)',
+        )
+
+    verify_subscribers.short_description = 'Verify and subscribe'
+
+    def unsubscribe_subscribers(self, request, queryset):
+        updated = queryset.bulk_unsubscribe()
+        messages.add_message(
+            request,
+            messages.SUCCESS,
+            f'Successfully unsubscribed {updated} subscriber(s)',
+        )
+
+    unsubscribe_subscribers.short_description = 'Unsubscribe'
+
 
 admin.site.register(Issue, IssueAdmin)
 admin.site.register(Newsletter, NewsletterAdmin)
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.conf import settings
 from django.urls import reverse_lazy
 
@@ -11,6 +13,16 @@ NEWSFEED_EMAIL_BATCH_SIZE = getattr(
 NEWSFEED_EMAIL_CONFIRMATION_EXPIRE_DAYS = getattr(
     settings, 'NEWSFEED_EMAIL_CONFIRMATION_EXPIRE_DAYS', 3
 )
+# Time after which a subscription confirmation link expires
+EMAIL_CONFIRMATION_EXPIRE_DELTA = timedelta(
+    days=NEWSFEED_EMAIL_CONFIRMATION_EXPIRE_DAYS
+)
+NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT = getattr(
+    settings, 'NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT', 0
+)
+NEWSFEED_SEND_VERIFICATION_EMAIL_IN_BACKGROUND = getattr(
+    settings, 'NEWSFEED_SEND_VERIFICATION_EMAIL_IN_BACKGROUND', False
+)
 NEWSFEED_SITE_BASE_URL = getattr(
     settings, 'NEWSFEED_SITE_BASE_URL', 'http://127.0.0.1:8000'
 )
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class NewsfeedConfig(AppConfig):
     name = 'newsfeed'
+
+    def ready(self):
+        from . import signals  # noqa: F401
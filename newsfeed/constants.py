@@ -1,3 +1,6 @@
+# Minutes to wait before sending a verification email again
+VERIFICATION_EMAIL_RESEND_MINUTES = 5
+
 DAILY_ISSUE = 1
 WEEKLY_ISSUE = 2
 MONTHLY_ISSUE = 2
@@ -3,3 +3,7 @@ from django import forms
 
 class SubscriberEmailForm(forms.Form):
     email_address = forms.EmailField()
+
+    def clean_email_address(self):
+        # Subscriber email addresses are stored in lower case
+        return self.cleaned_data['email_address'].lower()
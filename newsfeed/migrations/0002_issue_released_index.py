@@ -0,0 +1,17 @@
+# Generated by Django 3.1.14 on 2026-10-15 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsfeed', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(is_draft=False), fields=['-issue_number', '-publish_date'], name='newsfeed_issue_released_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.1.14 on 2026-10-15 02:23
+
+from django.db import migrations, models
+import uuid
+
+
+def normalize_tokens(apps, schema_editor):
+    """
+    Converts existing tokens to the 32 character hex form so that
+    they can be cast to a ``UUIDField`` on every database backend.
+    Tokens that are not valid UUIDs are replaced with a new one.
+    """
+    Subscriber = apps.get_model('newsfeed', 'Subscriber')
+    db_alias = schema_editor.connection.alias
+    subscribers = Subscriber.objects.using(db_alias).only('id', 'token')
+
+    for subscriber in subscribers.iterator():
+        try:
+            token = uuid.UUID(subscriber.token).hex
+        except ValueError:
+            token = uuid.uuid4().hex
+
+        Subscriber.objects.using(db_alias).filter(
+            id=subscriber.id
+        ).update(token=token)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsfeed', '0002_issue_released_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='subscriber',
+            name='token',
+            field=models.UUIDField(default=uuid.uuid4, unique=True),
+        ),
+    ]
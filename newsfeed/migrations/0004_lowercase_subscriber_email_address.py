@@ -0,0 +1,63 @@
+from django.db import migrations
+
+
+def lowercase_email_addresses(apps, schema_editor):
+    """
+    Converts existing subscriber email addresses to lower case.
+
+    Subscribers whose lower case address already belongs to another
+    subscriber are merged into that subscriber and deleted, otherwise
+    they could never be found by the unsubscribe form again. The kept
+    subscriber stays subscribed if either of them was subscribed, as
+    both of them were receiving the newsletter.
+    """
+    Subscriber = apps.get_model('newsfeed', 'Subscriber')
+    db_alias = schema_editor.connection.alias
+    subscribers = Subscriber.objects.using(db_alias)
+
+    rows = list(
+        subscribers.order_by('id').values_list(
+            'id', 'email_address', 'subscribed', 'verified'
+        )
+    )
+    # Prefer the subscribers that are already stored in lower case
+    kept_subscriber_ids = {
+        email_address: subscriber_id
+        for subscriber_id, email_address, _, _ in rows
+        if email_address == email_address.lower()
+    }
+
+    for subscriber_id, email_address, subscribed, verified in rows:
+        lower_email_address = email_address.lower()
+
+        if email_address == lower_email_address:
+            continue
+
+        kept_subscriber_id = kept_subscriber_ids.get(lower_email_address)
+
+        if kept_subscriber_id is None:
+            subscribers.filter(id=subscriber_id).update(
+                email_address=lower_email_address
+            )
+            kept_subscriber_ids[lower_email_address] = subscriber_id
+            continue
+
+        if subscribed and verified:
+            subscribers.filter(id=kept_subscriber_id).update(
+                subscribed=True, verified=True
+            )
+
+        subscribers.filter(id=subscriber_id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('newsfeed', '0003_subscriber_token_uuid'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            lowercase_email_addresses, migrations.RunPython.noop
+        ),
+    ]
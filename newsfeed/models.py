@@ -1,13 +1,46 @@
+import functools
 import uuid
 
-from django.db import models
-from django.urls import reverse
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.utils import timezone
-
-from .app_settings import NEWSFEED_EMAIL_CONFIRMATION_EXPIRE_DAYS
-from .constants import ISSUE_TYPE_CHOICES, WEEKLY_ISSUE
+from django.utils.translation import get_language
+
+from .app_settings import (
+    EMAIL_CONFIRMATION_EXPIRE_DELTA,
+    NEWSFEED_SEND_VERIFICATION_EMAIL_IN_BACKGROUND,
+)
+from .constants import (
+    ISSUE_TYPE_CHOICES,
+    VERIFICATION_EMAIL_RESEND_MINUTES,
+    WEEKLY_ISSUE,
+)
 from .querysets import IssueQuerySet, SubscriberQuerySet, PostQuerySet
-from .utils.send_verification import send_subscription_verification_email
+from .utils.send_verification import (
+    send_subscription_verification_email,
+    send_subscription_verification_email_in_background,
+)
+
+
+# Number of times a colliding token is regenerated before giving up
+TOKEN_RESET_ATTEMPTS = 3
+# Placeholder token used to build the verification URL template
+VERIFICATION_URL_TOKEN_PLACEHOLDER = str(uuid.UUID(int=0))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_verification_url_template(urlconf, script_prefix, language):
+    """
+    Reverses the subscription confirmation URL once per URLconf,
+    script prefix and language (for ``i18n_patterns``),
+    the token is substituted for each subscriber.
+    """
+    return reverse(
+        'newsfeed:newsletter_subscription_confirm',
+        kwargs={'token': VERIFICATION_URL_TOKEN_PLACEHOLDER},
+        urlconf=urlconf
+    )
 
 
 class Issue(models.Model):
@@ -30,6 +63,14 @@ class Issue(models.Model):
 
     class Meta:
         ordering = ['-issue_number', '-publish_date']
+        indexes = [
+            # Serves the default ordering of released (non-draft) issues
+            models.Index(
+                fields=['-issue_number', '-publish_date'],
+                condition=models.Q(is_draft=False),
+                name='newsfeed_issue_released_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -38,12 +79,25 @@ class Issue(models.Model):
     def is_published(self):
         return not self.is_draft and self.publish_date <= timezone.now()
 
-    def get_absolute_url(self):
-        return reverse(
-            'newsfeed:issue_detail',
-            kwargs={'issue_number': self.issue_number}
+    @property
+    def absolute_url(self):
+        # Reuse the reversed URL until the issue number changes
+        issue_number, url = self.__dict__.get(
+            '_absolute_url_cache', (None, None)
         )
 
+        if url is None or issue_number != self.issue_number:
+            url = reverse(
+                'newsfeed:issue_detail',
+                kwargs={'issue_number': self.issue_number}
+            )
+            self._absolute_url_cache = (self.issue_number, url)
+
+        return url
+
+    def get_absolute_url(self):
+        return self.absolute_url
+
 
 class PostCategory(models.Model):
     name = models.CharField(max_length=255)
@@ -110,7 +164,7 @@ class Newsletter(models.Model):
 
 class Subscriber(models.Model):
     email_address = models.EmailField(unique=True)
-    token = models.CharField(max_length=128, unique=True, default=uuid.uuid4)
+    token = models.UUIDField(unique=True, default=uuid.uuid4)
     verified = models.BooleanField(default=False)
     subscribed = models.BooleanField(default=False)
     verification_sent_date = models.DateTimeField(blank=True, null=True)
@@ -122,31 +176,54 @@ class Subscriber(models.Model):
     def __str__(self):
         return self.email_address
 
+    def clean_fields(self, exclude=None):
+        # Normalize before validation so that ``validate_unique`` catches
+        # addresses that only differ by case from an existing subscriber
+        self.email_address = self.email_address.lower()
+        super().clean_fields(exclude=exclude)
+
+    def save(self, *args, **kwargs):
+        # Store email addresses in lower case so that exact lookups
+        # match regardless of how the address was typed
+        if 'email_address' not in self.get_deferred_fields():
+            self.email_address = self.email_address.lower()
+
+        super().save(*args, **kwargs)
+
     def token_expired(self):
         if not self.verification_sent_date:
             return True
 
         expiration_date = (
-            self.verification_sent_date + timezone.timedelta(
-                days=NEWSFEED_EMAIL_CONFIRMATION_EXPIRE_DAYS
-            )
+            self.verification_sent_date + EMAIL_CONFIRMATION_EXPIRE_DELTA
         )
         return expiration_date <= timezone.now()
 
-    def reset_token(self):
-        unique_token = str(uuid.uuid4())
+    def reset_token(self, update_fields=()):
+        """
+        Generates a new token and saves it along with ``update_fields``
 
-        while self.__class__.objects.filter(token=unique_token).exists():
-            unique_token = str(uuid.uuid4())
+        The unique constraint on ``token`` is used to detect collisions
+        instead of querying for an existing token before saving.
+        """
+        update_fields = ['token', *update_fields]
 
-        self.token = unique_token
-        self.save()
+        for attempt in range(TOKEN_RESET_ATTEMPTS):
+            self.token = uuid.uuid4()
+
+            try:
+                with transaction.atomic():
+                    self.save(update_fields=update_fields)
+                return
+            except IntegrityError:
+                if attempt == TOKEN_RESET_ATTEMPTS - 1:
+                    raise
 
     def subscribe(self):
         if not self.token_expired():
             self.verified = True
             self.subscribed = True
-            self.save()
+            self.save(update_fields=['verified', 'subscribed'])
 
             return True
 
@@ -154,30 +231,46 @@ class Subscriber(models.Model):
         if self.subscribed:
             self.subscribed = False
             self.verified = False
-            self.save()
+            self.save(update_fields=['subscribed', 'verified'])
 
             return True
 
     def send_verification_email(self, created):
-        minutes_before = timezone.now() - timezone.timedelta(minutes=5)
+        minutes_before = timezone.now() - timezone.timedelta(
+            minutes=VERIFICATION_EMAIL_RESEND_MINUTES
+        )
         sent_date = self.verification_sent_date
 
         # Only send email again if the last sent date is five minutes earlier
         if sent_date and sent_date >= minutes_before:
             return
 
-        if not created:
-            self.reset_token()
-
         self.verification_sent_date = timezone.now()
-        self.save()
 
-        send_subscription_verification_email(
-            self.get_verification_url(), self.email_address
+        if created:
+            self.save(update_fields=['verification_sent_date'])
+        else:
+            self.reset_token(update_fields=['verification_sent_date'])
+
+        verification_url = self.get_verification_url()
+        email_address = self.email_address
+
+        if NEWSFEED_SEND_VERIFICATION_EMAIL_IN_BACKGROUND:
+            send_email = send_subscription_verification_email_in_background
+        else:
+            send_email = send_subscription_verification_email
+
+        # Send the email only after the new token has been committed
+        transaction.on_commit(
+            lambda: send_email(verification_url, email_address)
         )
 
     def get_verification_url(self):
-        return reverse(
-            'newsfeed:newsletter_subscription_confirm',
-            kwargs={'token': self.token}
+        url_template = _get_verification_url_template(
+            get_urlconf() or settings.ROOT_URLCONF,
+            get_script_prefix(),
+            get_language()
+        )
+        return url_template.replace(
+            VERIFICATION_URL_TOKEN_PLACEHOLDER, str(self.token)
         )
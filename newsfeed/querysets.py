@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models.functions import Now
 from django.utils import timezone
 
+from .app_settings import EMAIL_CONFIRMATION_EXPIRE_DELTA
+
 
 class IssueQuerySet(models.QuerySet):
 
@@ -12,6 +15,19 @@ class IssueQuerySet(models.QuerySet):
             publish_date__lte=timezone.now()
         )
 
+    def with_published_status(self):
+        """Annotates each issue with a database computed ``published`` flag"""
+        return self.annotate(
+            published=models.Case(
+                models.When(
+                    is_draft=False, publish_date__lte=Now(),
+                    then=models.Value(True)
+                ),
+                default=models.Value(False),
+                output_field=models.BooleanField()
+            )
+        )
+
 
 class SubscriberQuerySet(models.QuerySet):
 
@@ -20,6 +36,23 @@ class SubscriberQuerySet(models.QuerySet):
     def subscribed(self):
         return self.filter(verified=True, subscribed=True)
 
+    def expired_tokens(self):
+        expiration_date = timezone.now() - EMAIL_CONFIRMATION_EXPIRE_DELTA
+        never_sent = models.Q(verification_sent_date__isnull=True)
+        expired = models.Q(verification_sent_date__lte=expiration_date)
+
+        return self.filter(never_sent | expired)
+
+    def bulk_unsubscribe(self):
+        return self.filter(subscribed=True).update(
+            subscribed=False, verified=False
+        )
+
+    def bulk_verify(self):
+        return self.filter(verified=False).update(
+            verified=True, subscribed=True
+        )
+
 
 class PostQuerySet(models.QuerySet):
 
@@ -27,3 +60,6 @@ class PostQuerySet(models.QuerySet):
 
     def visible(self):
         return self.filter(is_visible=True)
+
+    def with_relations(self):
+        return self.select_related('issue', 'category')
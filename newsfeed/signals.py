@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Issue
+from .utils.cache import invalidate_issue_list_cache
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+def issue_changed(sender, **kwargs):
+    invalidate_issue_list_cache()
@@ -0,0 +1,23 @@
+import uuid
+
+from django.core.cache import cache
+
+
+ISSUE_LIST_CACHE_VERSION_KEY = 'newsfeed_issue_list_version'
+
+
+def get_issue_list_cache_version():
+    """
+    Returns the current version of the cached issue list
+
+    The version is part of the issue list template fragment cache key
+    so changing it makes all the cached fragments stale at once.
+    """
+    return cache.get_or_set(
+        ISSUE_LIST_CACHE_VERSION_KEY, lambda: uuid.uuid4().hex, None
+    )
+
+
+def invalidate_issue_list_cache():
+    """Discards the cached issue list by dropping its version"""
+    cache.delete(ISSUE_LIST_CACHE_VERSION_KEY)
@@ -1,16 +1,28 @@
+import logging
+import threading
+
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
 from django.template.loader import render_to_string
+from django.utils import timezone
 
 from newsfeed.app_settings import NEWSFEED_SITE_BASE_URL
+from newsfeed.constants import VERIFICATION_EMAIL_RESEND_MINUTES
 
 
-def send_subscription_verification_email(verification_url, to_email):
+logger = logging.getLogger(__name__)
+
+
+def _generate_verification_email_message(
+    verification_url, to_email, connection=None
+):
     """
-    Sends verification e-mail to subscribers
+    Generates verification e-mail message for a subscriber
 
     :param verification_url: subscribers unique verification url
     :param to_email: subscribers email
+    :param connection: e-mail backend connection used to send the message
     """
     context = {
         'site_url': NEWSFEED_SITE_BASE_URL,
@@ -31,8 +43,106 @@ def send_subscription_verification_email(verification_url, to_email):
     )
 
     message = EmailMultiAlternatives(
-        subject, text_body, settings.EMAIL_HOST_USER, [to_email]
+        subject, text_body, settings.EMAIL_HOST_USER, [to_email],
+        connection=connection
     )
 
     message.attach_alternative(html_body, 'text/html')
+
+    return message
+
+
+def send_subscription_verification_email(verification_url, to_email):
+    """
+    Sends verification e-mail to subscribers
+
+    :param verification_url: subscribers unique verification url
+    :param to_email: subscribers email
+    """
+    message = _generate_verification_email_message(verification_url, to_email)
     message.send()
+
+
+def _send_subscription_verification_email_logged(verification_url, to_email):
+    try:
+        send_subscription_verification_email(verification_url, to_email)
+    except Exception as e:
+        logger.error(
+            'An error occurred while sending verification e-mail '
+            'to %s EXCEPTION: %s',
+            to_email, e
+        )
+
+
+def send_subscription_verification_email_in_background(
+    verification_url, to_email
+):
+    """
+    Sends verification e-mail to subscribers from a background thread
+    so that the request does not wait for the e-mail server
+
+    :param verification_url: subscribers unique verification url
+    :param to_email: subscribers email
+    """
+    thread = threading.Thread(
+        target=_send_subscription_verification_email_logged,
+        args=(verification_url, to_email),
+        daemon=True
+    )
+    thread.start()
+
+    return thread
+
+
+def send_subscription_verification_emails(verification_emails):
+    """
+    Sends verification e-mails to subscribers with one connection open
+
+    :param verification_emails: list of ``(verification_url, to_email)``
+    """
+    with get_connection() as connection:
+        messages = [
+            _generate_verification_email_message(
+                verification_url, to_email, connection=connection
+            )
+            for verification_url, to_email in verification_emails
+        ]
+        return connection.send_messages(messages)
+
+
+def send_verification_emails_bulk(subscribers):
+    """
+    Renews the token of the unverified subscribers and sends them
+    verification e-mails with one connection open,
+    returns the number of e-mails that will be sent
+
+    Subscribers who received a verification e-mail recently are skipped.
+    Unsubscribed subscribers are unverified too, so ``subscribers``
+    should only contain subscribers that should be asked to confirm.
+
+    :param subscribers: Subscriber QuerySet
+    """
+    minutes_before = timezone.now() - timezone.timedelta(
+        minutes=VERIFICATION_EMAIL_RESEND_MINUTES
+    )
+    subscribers = subscribers.filter(verified=False).exclude(
+        verification_sent_date__gte=minutes_before
+    )
+    verification_emails = []
+
+    for subscriber in subscribers:
+        subscriber.verification_sent_date = timezone.now()
+        subscriber.reset_token(update_fields=['verification_sent_date'])
+        verification_emails.append(
+            (subscriber.get_verification_url(), subscriber.email_address)
+        )
+
+    if verification_emails:
+        # Send the emails only after the new tokens have been committed
+        transaction.on_commit(
+            lambda: send_subscription_verification_emails(
+                verification_emails
+            )
+        )
+
+    return len(verification_emails)
@@ -5,11 +5,13 @@ from django.views.generic import DetailView, FormView, ListView, TemplateView
 from django.views.generic.detail import SingleObjectMixin
 
 from .app_settings import (
+    NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT,
     NEWSFEED_SUBSCRIPTION_REDIRECT_URL,
     NEWSFEED_UNSUBSCRIPTION_REDIRECT_URL,
 )
 from .forms import SubscriberEmailForm
 from .models import Issue, Post, Subscriber
+from .utils.cache import get_issue_list_cache_version
 
 
 class IssueListView(ListView):
@@ -20,6 +22,12 @@ class IssueListView(ListView):
     def get_queryset(self):
         return super().get_queryset().released()
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['cache_timeout'] = NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT
+        context['cache_version'] = get_issue_list_cache_version()
+        return context
+
 
 class IssueDetailView(SingleObjectMixin, ListView):
     model = Post
@@ -150,7 +158,10 @@ class NewsletterSubscriptionConfirmView(DetailView):
     slug_field = 'token'
 
     def get_queryset(self):
-        return super().get_queryset().filter(verified=False)
+        return super().get_queryset().filter(verified=False).only(
+            'id', 'email_address', 'verified',
+            'subscribed', 'verification_sent_date',
+        )
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -1,3 +1,4 @@
+import re
 from unittest import mock
 
 from django.contrib.auth.models import User
@@ -7,7 +8,8 @@ from django.utils import timezone
 
 from model_bakery import baker
 
-from newsfeed.models import Issue, Newsletter, Post
+from newsfeed.models import Issue, Newsletter, Post, Subscriber
+from newsfeed.utils.cache import get_issue_list_cache_version
 
 
 class IssueAdminTest(TestCase):
@@ -27,6 +29,56 @@ class IssueAdminTest(TestCase):
         )
         self.client.force_login(self.admin)
 
+    def _get_published_column(self, response):
+        """Returns the shown ``is_published`` values by issue id"""
+        shown_values = re.findall(
+            r'<td class="field-is_published">'
+            r'<img src="[^"]*" alt="(True|False)"></td>',
+            response.content.decode()
+        )
+        issue_ids = [issue.id for issue in response.context['cl'].result_list]
+
+        return dict(zip(issue_ids, shown_values))
+
+    def test_changelist_shows_published_status(self):
+        future_issue = baker.make(
+            Issue, is_draft=False,
+            publish_date=timezone.now() + timezone.timedelta(days=1)
+        )
+
+        response = self.client.get(reverse('admin:newsfeed_issue_changelist'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._get_published_column(response),
+            {
+                self.released_issue.id: 'True',
+                self.unreleased_issue.id: 'False',
+                future_issue.id: 'False',
+            }
+        )
+
+    def test_changelist_sorted_by_published_status(self):
+        changelist_url = reverse('admin:newsfeed_issue_changelist')
+        response = self.client.get(changelist_url)
+
+        self.assertContains(response, 'class="sortable column-is_published"')
+
+        # is_published is the sixth column after the action checkbox
+        response = self.client.get(changelist_url, {'o': '6'})
+
+        self.assertEqual(
+            list(self._get_published_column(response).values()),
+            ['False', 'True']
+        )
+
+        response = self.client.get(changelist_url, {'o': '-6'})
+
+        self.assertEqual(
+            list(self._get_published_column(response).values()),
+            ['True', 'False']
+        )
+
     def test_publish_issues_action(self):
         self.assertTrue(self.unreleased_issue.is_draft)
         data = {
@@ -45,6 +97,17 @@ class IssueAdminTest(TestCase):
         self.unreleased_issue.refresh_from_db()
         self.assertFalse(self.unreleased_issue.is_draft)
 
+    def test_publish_issues_action_invalidates_issue_list_cache(self):
+        cache_version = get_issue_list_cache_version()
+        data = {
+            'action': 'publish_issues',
+            '_selected_action': [self.unreleased_issue.id]
+        }
+
+        self.client.post(reverse('admin:newsfeed_issue_changelist'), data)
+
+        self.assertNotEqual(cache_version, get_issue_list_cache_version())
+
     def test_make_draft_action(self):
         self.assertFalse(self.released_issue.is_draft)
         data = {
@@ -148,3 +211,81 @@ class PostAdminTest(TestCase):
 
         self.invisible_post.refresh_from_db()
         self.assertTrue(self.invisible_post.is_visible)
+
+
+class SubscriberAdminTest(TestCase):
+
+    def setUp(self):
+        self.admin = baker.make(
+            User, username='admin', password='test_passWord',
+            is_staff=True, is_superuser=True
+        )
+        self.verified_subscriber = baker.make(
+            Subscriber, subscribed=True, verified=True
+        )
+        self.unverified_subscriber = baker.make(
+            Subscriber, subscribed=False, verified=False
+        )
+
+        self.client.force_login(self.admin)
+
+    def test_verify_subscribers_action(self):
+        self.assertFalse(self.unverified_subscriber.verified)
+        data = {
+            'action': 'verify_subscribers',
+            '_selected_action': [self.unverified_subscriber.id]
+        }
+
+        response = self.client.post(
+            reverse('admin:newsfeed_subscriber_changelist'), data
+        )
+
+        self.assertRedirects(
+            response, reverse('admin:newsfeed_subscriber_changelist')
+        )
+
+        self.unverified_subscriber.refresh_from_db()
+        self.assertTrue(self.unverified_subscriber.verified)
+        self.assertTrue(self.unverified_subscriber.subscribed)
+
+    def test_unsubscribe_subscribers_action(self):
+        self.assertTrue(self.verified_subscriber.subscribed)
+        data = {
+            'action': 'unsubscribe_subscribers',
+            '_selected_action': [self.verified_subscriber.id]
+        }
+
+        response = self.client.post(
+            reverse('admin:newsfeed_subscriber_changelist'), data
+        )
+
+        self.assertRedirects(
+            response, reverse('admin:newsfeed_subscriber_changelist')
+        )
+
+        self.verified_subscriber.refresh_from_db()
+        self.assertFalse(self.verified_subscriber.verified)
+        self.assertFalse(self.verified_subscriber.subscribed)
+
+    def test_add_subscriber_with_email_address_differing_by_case(self):
+        data = {
+            'email_address': self.verified_subscriber.email_address.upper(),
+            'subscribed': 'on',
+            'verification_sent_date_0': '',
+            'verification_sent_date_1': '',
+        }
+
+        response = self.client.post(
+            reverse('admin:newsfeed_subscriber_add'), data
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'email_address', response.context['adminform'].form.errors
+        )
+        self.assertEqual(
+            Subscriber.objects.filter(
+                email_address__iexact=self.verified_subscriber.email_address
+            ).count(),
+            1
+        )
@@ -1,7 +1,10 @@
 from unittest import mock
+from uuid import uuid4
 
-from django.test import TestCase
-from django.utils import timezone
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from django.utils import timezone, translation
 
 from model_bakery import baker
 
@@ -11,8 +14,12 @@ from newsfeed.models import Issue, Newsletter, Post, PostCategory, Subscriber
 class PostModelTest(TestCase):
 
     def setUp(self):
-        self.invisible_posts = baker.make(Post, is_visible=False, _quantity=2)
-        self.visible_posts = baker.make(Post, is_visible=True, _quantity=2)
+        self.invisible_posts = Post.objects.bulk_create(
+            baker.prepare(Post, is_visible=False, _quantity=2)
+        )
+        self.visible_posts = Post.objects.bulk_create(
+            baker.prepare(Post, is_visible=True, _quantity=2)
+        )
 
     def test_str(self):
         post = Post.objects.visible().first()
@@ -28,6 +35,14 @@ class PostModelTest(TestCase):
 
         self.assertEqual(posts.count(), 4)
 
+    def test_with_relations_queryset(self):
+        baker.make(Post, _fill_optional=['issue', 'category'])
+
+        with self.assertNumQueries(1):
+            post = Post.objects.with_relations().get(issue__isnull=False)
+            self.assertIsNotNone(post.issue.title)
+            self.assertIsNotNone(post.category.name)
+
 
 class IssueModelTest(TestCase):
 
@@ -69,10 +84,50 @@ class IssueModelTest(TestCase):
         self.assertTrue(self.released_issue.is_published)
         self.assertFalse(self.unreleased_issue.is_published)
 
+    def test_with_published_status_queryset(self):
+        future_issue = baker.make(
+            Issue, is_draft=False,
+            publish_date=timezone.now() + timezone.timedelta(days=1),
+        )
+        issues = Issue.objects.with_published_status()
+
+        self.assertTrue(issues.get(id=self.released_issue.id).published)
+        self.assertFalse(issues.get(id=self.unreleased_issue.id).published)
+        self.assertFalse(issues.get(id=future_issue.id).published)
+
     def test_get_absolute_url(self):
         expected_url = f'/newsfeed/issues/{self.released_issue.issue_number}/'
         self.assertEqual(self.released_issue.get_absolute_url(), expected_url)
 
+    @mock.patch('newsfeed.models.reverse')
+    def test_get_absolute_url_is_cached(self, reverse):
+        reverse.return_value = '/newsfeed/issues/1/'
+
+        self.released_issue.get_absolute_url()
+        self.released_issue.get_absolute_url()
+
+        reverse.assert_called_once()
+
+    def test_get_absolute_url_after_issue_number_change(self):
+        self.released_issue.get_absolute_url()
+
+        self.released_issue.issue_number += 1
+        self.released_issue.save()
+
+        expected_url = f'/newsfeed/issues/{self.released_issue.issue_number}/'
+        self.assertEqual(self.released_issue.get_absolute_url(), expected_url)
+
+    def test_get_absolute_url_after_refresh_from_db(self):
+        self.released_issue.get_absolute_url()
+        Issue.objects.filter(id=self.released_issue.id).update(
+            issue_number=self.released_issue.issue_number + 1
+        )
+
+        self.released_issue.refresh_from_db()
+
+        expected_url = f'/newsfeed/issues/{self.released_issue.issue_number}/'
+        self.assertEqual(self.released_issue.get_absolute_url(), expected_url)
+
 
 class SubscriberModelTest(TestCase):
 
@@ -88,6 +143,22 @@ class SubscriberModelTest(TestCase):
         subscriber = Subscriber.objects.subscribed().first()
         self.assertEqual(subscriber.email_address, str(subscriber))
 
+    def test_save_lowercases_email_address(self):
+        subscriber = baker.make(Subscriber, email_address='Test@Example.com')
+        subscriber.refresh_from_db()
+
+        self.assertEqual(subscriber.email_address, 'test@example.com')
+
+    def test_full_clean_rejects_email_address_differing_by_case(self):
+        baker.make(Subscriber, email_address='test@example.com')
+        subscriber = Subscriber(email_address='Test@Example.com')
+
+        with self.assertRaises(ValidationError) as cm:
+            subscriber.full_clean()
+
+        self.assertIn('email_address', cm.exception.message_dict)
+        self.assertEqual(subscriber.email_address, 'test@example.com')
+
     def test_all_queryset(self):
         subscribers = Subscriber.objects.all()
 
@@ -98,6 +169,41 @@ class SubscriberModelTest(TestCase):
 
         self.assertEqual(subscribers.count(), 1)
 
+    def test_bulk_unsubscribe_queryset(self):
+        unsubscribed = Subscriber.objects.bulk_unsubscribe()
+
+        self.assertEqual(unsubscribed, 1)
+        self.assertFalse(Subscriber.objects.subscribed().exists())
+
+    def test_bulk_verify_queryset(self):
+        verified = Subscriber.objects.filter(
+            token__in=[self.unverified_subscriber.token]
+        ).bulk_verify()
+
+        self.assertEqual(verified, 1)
+        self.assertEqual(Subscriber.objects.subscribed().count(), 2)
+
+    def test_expired_tokens_queryset(self):
+        self.verified_subscriber.verification_sent_date = timezone.now()
+        self.verified_subscriber.save()
+        self.unverified_subscriber.verification_sent_date = (
+            timezone.now() - timezone.timedelta(days=3)
+        )
+        self.unverified_subscriber.save()
+        never_sent_subscriber = baker.make(
+            Subscriber, subscribed=False, verified=False,
+            verification_sent_date=None
+        )
+
+        subscribers = Subscriber.objects.expired_tokens()
+
+        self.assertEqual(
+            set(subscribers.values_list('id', flat=True)),
+            {self.unverified_subscriber.id, never_sent_subscriber.id}
+        )
+        for subscriber in subscribers:
+            self.assertTrue(subscriber.token_expired())
+
     def test_token_expired(self):
         self.unverified_subscriber.verification_sent_date = (
             timezone.now() - timezone.timedelta(days=3)
@@ -127,14 +233,27 @@ class SubscriberModelTest(TestCase):
     @mock.patch('newsfeed.models.uuid')
     def test_reset_token_with_existing_token(self, uuid):
         old_token = self.unverified_subscriber.token
-        new_token = 'new_token'
-        uuid.uuid4.side_effect = [old_token, new_token]
+        existing_token = self.verified_subscriber.token
+        new_token = uuid4()
+        uuid.uuid4.side_effect = [existing_token, new_token]
 
         self.unverified_subscriber.reset_token()
+        self.unverified_subscriber.refresh_from_db()
 
         self.assertNotEqual(old_token, self.unverified_subscriber.token)
         self.assertEqual(new_token, self.unverified_subscriber.token)
 
+    @mock.patch('newsfeed.models.uuid')
+    def test_reset_token_with_too_many_existing_tokens(self, uuid):
+        old_token = self.unverified_subscriber.token
+        uuid.uuid4.return_value = self.verified_subscriber.token
+
+        with self.assertRaises(IntegrityError):
+            self.unverified_subscriber.reset_token()
+
+        self.unverified_subscriber.refresh_from_db()
+        self.assertEqual(old_token, self.unverified_subscriber.token)
+
     def test_subscribe(self):
         self.unverified_subscriber.verification_sent_date = timezone.now()
         self.unverified_subscriber.save()
@@ -184,9 +303,13 @@ class SubscriberModelTest(TestCase):
         self.assertFalse(self.verified_subscriber.verified)
         self.assertFalse(self.verified_subscriber.subscribed)
 
+    @mock.patch(
+        'newsfeed.models.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
     @mock.patch('newsfeed.models.send_subscription_verification_email')
     def test_send_verification_email_with_existing_email(
-        self, send_verification_email
+        self, send_verification_email, on_commit
     ):
         old_token = self.unverified_subscriber.token
 
@@ -198,9 +321,13 @@ class SubscriberModelTest(TestCase):
             self.unverified_subscriber.email_address
         )
 
+    @mock.patch(
+        'newsfeed.models.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
     @mock.patch('newsfeed.models.send_subscription_verification_email')
     def test_send_verification_email_with_new_email(
-        self, send_verification_email
+        self, send_verification_email, on_commit
     ):
         new_unverified_subscriber = baker.make(
             Subscriber, subscribed=False, verified=False
@@ -215,6 +342,65 @@ class SubscriberModelTest(TestCase):
             new_unverified_subscriber.email_address
         )
 
+    def test_unsubscribe_only_updates_subscription_fields(self):
+        email_address = self.verified_subscriber.email_address
+        self.verified_subscriber.email_address = 'changed@example.com'
+
+        self.verified_subscriber.unsubscribe()
+        self.verified_subscriber.refresh_from_db()
+
+        self.assertFalse(self.verified_subscriber.subscribed)
+        self.assertEqual(self.verified_subscriber.email_address, email_address)
+
+    def test_subscribe_only_updates_subscription_fields(self):
+        self.unverified_subscriber.verification_sent_date = timezone.now()
+        self.unverified_subscriber.save()
+        email_address = self.unverified_subscriber.email_address
+        self.unverified_subscriber.email_address = 'changed@example.com'
+
+        self.unverified_subscriber.subscribe()
+        self.unverified_subscriber.refresh_from_db()
+
+        self.assertTrue(self.unverified_subscriber.subscribed)
+        self.assertEqual(
+            self.unverified_subscriber.email_address, email_address
+        )
+
+    @mock.patch(
+        'newsfeed.models.NEWSFEED_SEND_VERIFICATION_EMAIL_IN_BACKGROUND', True
+    )
+    @mock.patch(
+        'newsfeed.models.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    @mock.patch(
+        'newsfeed.models.send_subscription_verification_email_in_background'
+    )
+    @mock.patch('newsfeed.models.send_subscription_verification_email')
+    def test_send_verification_email_in_background(
+        self, send_verification_email, send_in_background, on_commit
+    ):
+        self.unverified_subscriber.send_verification_email(False)
+
+        send_verification_email.assert_not_called()
+        send_in_background.assert_called_once_with(
+            self.unverified_subscriber.get_verification_url(),
+            self.unverified_subscriber.email_address
+        )
+
+    @mock.patch('newsfeed.models.send_subscription_verification_email')
+    def test_send_verification_email_waits_for_commit(
+        self, send_verification_email
+    ):
+        old_token = self.unverified_subscriber.token
+
+        self.unverified_subscriber.send_verification_email(False)
+        self.unverified_subscriber.refresh_from_db()
+
+        self.assertNotEqual(self.unverified_subscriber.token, old_token)
+        self.assertIsNotNone(self.unverified_subscriber.verification_sent_date)
+        send_verification_email.assert_not_called()
+
     @mock.patch('newsfeed.models.send_subscription_verification_email')
     def test_send_verification_email_dont_send_email(
         self, send_verification_email
@@ -242,6 +428,33 @@ class SubscriberModelTest(TestCase):
             expected_url
         )
 
+    def test_get_verification_url_substitutes_token(self):
+        # warm the verification URL template cache with another token
+        self.unverified_subscriber.get_verification_url()
+        expected_url = (
+            f'/newsfeed/subscribe/confirm/{self.verified_subscriber.token}/'
+        )
+        self.assertEqual(
+            self.verified_subscriber.get_verification_url(),
+            expected_url
+        )
+
+    @override_settings(ROOT_URLCONF='tests.i18n_urls')
+    def test_get_verification_url_with_language_prefix(self):
+        token = self.unverified_subscriber.token
+
+        with translation.override('en'):
+            self.assertEqual(
+                self.unverified_subscriber.get_verification_url(),
+                f'/en/newsfeed/subscribe/confirm/{token}/'
+            )
+
+        with translation.override('de'):
+            self.assertEqual(
+                self.unverified_subscriber.get_verification_url(),
+                f'/de/newsfeed/subscribe/confirm/{token}/'
+            )
+
 
 class NewsletterModelTest(TestCase):
 
@@ -8,7 +8,10 @@ from model_bakery import baker
 
 from newsfeed.models import Issue, Subscriber, Newsletter
 from newsfeed.utils.send_verification import (
-    send_subscription_verification_email
+    send_subscription_verification_email,
+    send_subscription_verification_email_in_background,
+    send_subscription_verification_emails,
+    send_verification_emails_bulk,
 )
 from newsfeed.utils.send_newsletters import (
     NewsletterEmailSender, send_email_newsletter
@@ -42,6 +45,109 @@ class SendSubscriptionVerificationEmailTest(TestCase):
             mail.outbox[0].body
         )
 
+    def test_send_subscription_verification_email_in_background(self):
+        thread = send_subscription_verification_email_in_background(
+            self.unverified_subscriber.get_verification_url(),
+            self.unverified_subscriber.email_address
+        )
+        thread.join()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            mail.outbox[0].to,
+            [self.unverified_subscriber.email_address]
+        )
+
+    @mock.patch('newsfeed.utils.send_verification.logger')
+    @mock.patch(
+        'newsfeed.utils.send_verification.'
+        'send_subscription_verification_email',
+        side_effect=Exception('Test Exception')
+    )
+    def test_send_subscription_verification_email_in_background_with_error(
+        self, send_subscription_verification_email, logger
+    ):
+        thread = send_subscription_verification_email_in_background(
+            self.unverified_subscriber.get_verification_url(),
+            self.unverified_subscriber.email_address
+        )
+        thread.join()
+
+        self.assertEqual(len(mail.outbox), 0)
+        logger.error.assert_called_once()
+
+    @mock.patch('newsfeed.utils.send_verification.get_connection')
+    def test_send_subscription_verification_emails(self, get_connection):
+        connection = get_connection.return_value.__enter__.return_value
+        subscribers = [
+            self.unverified_subscriber,
+            baker.make(Subscriber, subscribed=False, verified=False),
+        ]
+
+        send_subscription_verification_emails([
+            (subscriber.get_verification_url(), subscriber.email_address)
+            for subscriber in subscribers
+        ])
+
+        get_connection.assert_called_once()
+        connection.send_messages.assert_called_once()
+
+        messages = connection.send_messages.call_args[0][0]
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(
+            [message.to for message in messages],
+            [[subscriber.email_address] for subscriber in subscribers]
+        )
+        self.assertIn(
+            subscribers[1].get_verification_url(),
+            messages[1].body
+        )
+
+    @mock.patch(
+        'newsfeed.utils.send_verification.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    def test_send_verification_emails_bulk(self, on_commit):
+        old_token = self.unverified_subscriber.token
+        # recently emailed and verified subscribers are skipped
+        baker.make(
+            Subscriber, subscribed=False, verified=False,
+            verification_sent_date=timezone.now()
+        )
+        baker.make(Subscriber, subscribed=True, verified=True)
+
+        sent = send_verification_emails_bulk(Subscriber.objects.all())
+
+        self.unverified_subscriber.refresh_from_db()
+
+        self.assertEqual(sent, 1)
+        self.assertNotEqual(old_token, self.unverified_subscriber.token)
+        self.assertIsNotNone(self.unverified_subscriber.verification_sent_date)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(
+            mail.outbox[0].to, [self.unverified_subscriber.email_address]
+        )
+
+    @mock.patch(
+        'newsfeed.utils.send_verification.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    def test_send_verification_emails_bulk_only_given_subscribers(
+        self, on_commit
+    ):
+        other_subscriber = baker.make(
+            Subscriber, subscribed=False, verified=False
+        )
+
+        sent = send_verification_emails_bulk(
+            Subscriber.objects.filter(id=other_subscriber.id)
+        )
+
+        self.assertEqual(sent, 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [other_subscriber.email_address])
+
 
 class SendNewsletterEmailTest(TestCase):
 
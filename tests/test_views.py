@@ -1,10 +1,12 @@
 import json
 from unittest import mock
 
+from django.conf import settings
 from django.contrib.messages import get_messages
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
-from django.utils import timezone
+from django.utils import timezone, translation
 
 from model_bakery import baker
 
@@ -13,14 +15,39 @@ from newsfeed.models import Issue, Post, Subscriber
 
 class IssueListViewTest(TestCase):
 
-    def setUp(self):
-        self.released_issues = baker.make(
-            Issue, is_draft=False, _quantity=16,
-            publish_date=timezone.now() - timezone.timedelta(days=1)
+    @classmethod
+    def setUpTestData(cls):
+        cls.released_issues = Issue.objects.bulk_create(
+            baker.prepare(
+                Issue, is_draft=False, _quantity=16,
+                publish_date=timezone.now() - timezone.timedelta(days=1)
+            )
         )
 
+    def setUp(self):
+        # bulk_create does not send signals to invalidate the cache
+        cache.clear()
+
     def test_issue_list_view_url_exists(self):
-        response = self.client.get(reverse('newsfeed:issue_list'))
+        # one query to count the issues and one to fetch the page
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('newsfeed:issue_list'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_issue_list_view_not_cached_by_default(self):
+        self.client.get(reverse('newsfeed:issue_list'))
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('newsfeed:issue_list'))
+        self.assertEqual(response.status_code, 200)
+
+    @mock.patch('newsfeed.views.NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT', 300)
+    def test_issue_list_view_cached(self):
+        self.client.get(reverse('newsfeed:issue_list'))
+
+        # only the paginator count query runs when the page is cached
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('newsfeed:issue_list'))
         self.assertEqual(response.status_code, 200)
 
     def test_issue_list_view_uses_correct_template(self):
@@ -35,6 +62,46 @@ class IssueListViewTest(TestCase):
         self.assertTrue(response.context['is_paginated'])
         self.assertTrue(len(response.context['object_list']) == 15)
 
+    @mock.patch('newsfeed.views.NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT', 300)
+    def test_issue_list_view_cache_invalidated_on_issue_change(self):
+        issue = Issue.objects.latest('issue_number')
+
+        response = self.client.get(reverse('newsfeed:issue_list'))
+        self.assertContains(response, issue.title)
+
+        issue.title = 'Updated Issue Title'
+        issue.save()
+
+        response = self.client.get(reverse('newsfeed:issue_list'))
+        self.assertContains(response, 'Updated Issue Title')
+
+        issue.delete()
+
+        response = self.client.get(reverse('newsfeed:issue_list'))
+        self.assertNotContains(response, 'Updated Issue Title')
+
+    @mock.patch('newsfeed.views.NEWSFEED_ISSUE_LIST_CACHE_TIMEOUT', 300)
+    @override_settings(
+        ROOT_URLCONF='tests.i18n_urls',
+        MIDDLEWARE=settings.MIDDLEWARE + [
+            'django.middleware.locale.LocaleMiddleware'
+        ]
+    )
+    def test_issue_list_view_cache_varies_by_language(self):
+        # LocaleMiddleware leaves the requested language active
+        self.addCleanup(translation.deactivate)
+        issue = Issue.objects.latest('issue_number')
+
+        self.client.get('/en/newsfeed/issues/')
+        response = self.client.get('/de/newsfeed/issues/')
+
+        self.assertContains(
+            response, f'/de/newsfeed/issues/{issue.issue_number}/'
+        )
+        self.assertNotContains(
+            response, f'/en/newsfeed/issues/{issue.issue_number}/'
+        )
+
     def test_issue_list_view_doesnt_show_draft_issues(self):
         Issue.objects.update(is_draft=True)
 
@@ -57,24 +124,29 @@ class IssueListViewTest(TestCase):
 
 class IssueDetailViewTest(TestCase):
 
-    def setUp(self):
-        self.released_issue = baker.make(
+    @classmethod
+    def setUpTestData(cls):
+        cls.released_issue = baker.make(
             Issue, is_draft=False,
             publish_date=timezone.now() - timezone.timedelta(days=1)
         )
-        self.unreleased_issue = baker.make(Issue, is_draft=True)
-        self.posts = baker.make(
-            Post, is_visible=True,
-            issue=self.released_issue, _quantity=2
+        cls.unreleased_issue = baker.make(Issue, is_draft=True)
+        cls.posts = baker.make(
+            Post, is_visible=True, _fill_optional=['category'],
+            issue=cls.released_issue, _quantity=2
         )
 
     def test_issue_detail_view_url_exists(self):
-        response = self.client.get(
-            reverse(
-                'newsfeed:issue_detail',
-                kwargs={'issue_number': self.released_issue.issue_number}
+        # one query for the issue and one for its posts with categories
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse(
+                    'newsfeed:issue_detail',
+                    kwargs={
+                        'issue_number': self.released_issue.issue_number
+                    }
+                )
             )
-        )
         self.assertTrue('issue' in response.context)
         self.assertEqual(response.status_code, 200)
 
@@ -113,18 +185,21 @@ class IssueDetailViewTest(TestCase):
 
 class LatestIssueViewTest(TestCase):
 
-    def setUp(self):
-        self.released_issue = baker.make(
+    @classmethod
+    def setUpTestData(cls):
+        cls.released_issue = baker.make(
             Issue, is_draft=False, _quantity=2,
             publish_date=timezone.now() - timezone.timedelta(days=1)
         )
-        self.posts = baker.make(
-            Post, is_visible=True,
-            _quantity=2, issue=self.released_issue[1]
+        cls.posts = baker.make(
+            Post, is_visible=True, _fill_optional=['category'],
+            _quantity=2, issue=cls.released_issue[1]
         )
 
     def test_latest_issue_view_url_exists(self):
-        response = self.client.get(reverse('newsfeed:latest_issue'))
+        # one query for the issue and one for its posts with categories
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('newsfeed:latest_issue'))
 
         self.assertTrue('latest_issue' in response.context)
         self.assertEqual(response.status_code, 200)
@@ -163,8 +238,9 @@ class LatestIssueViewTest(TestCase):
 
 class NewsletterSubscribeViewTest(TestCase):
 
-    def setUp(self):
-        self.verified_subscriber = baker.make(
+    @classmethod
+    def setUpTestData(cls):
+        cls.verified_subscriber = baker.make(
             Subscriber, subscribed=True, verified=True
         )
 
@@ -206,6 +282,31 @@ class NewsletterSubscribeViewTest(TestCase):
         )
         send_verification_email.assert_called_once_with(True)
 
+    @mock.patch('newsfeed.models.Subscriber.send_verification_email')
+    def test_newsfeed_subscribe_view_existing_unsubscribed_email(
+        self, send_verification_email
+    ):
+        unsubscribed_subscriber = baker.make(
+            Subscriber, subscribed=False, verified=False
+        )
+
+        response = self.client.post(
+            reverse('newsfeed:newsletter_subscribe'),
+            data={"email_address": unsubscribed_subscriber.email_address}
+        )
+
+        self.assertRedirects(
+            response, reverse('newsfeed:issue_list'),
+            status_code=302, target_status_code=200
+        )
+
+        subscribers = Subscriber.objects.filter(
+            email_address=unsubscribed_subscriber.email_address
+        )
+
+        self.assertEqual(subscribers.count(), 1)
+        send_verification_email.assert_called_once_with(False)
+
     @mock.patch('newsfeed.models.Subscriber.send_verification_email')
     def test_newsfeed_subscribe_view_already_subscribed(
         self, send_verification_email
@@ -229,6 +330,27 @@ class NewsletterSubscribeViewTest(TestCase):
         )
         send_verification_email.assert_not_called()
 
+    @mock.patch('newsfeed.models.Subscriber.send_verification_email')
+    def test_newsfeed_subscribe_view_already_subscribed_mixed_case(
+        self, send_verification_email
+    ):
+        response = self.client.post(
+            reverse('newsfeed:newsletter_subscribe'),
+            data={
+                "email_address":
+                    self.verified_subscriber.email_address.upper()
+            },
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        response_data = json.loads(response.content)
+
+        self.assertFalse(response_data['success'])
+        self.assertEqual(Subscriber.objects.count(), 1)
+        send_verification_email.assert_not_called()
+
     @mock.patch('newsfeed.models.Subscriber.send_verification_email')
     def test_newsfeed_subscribe_view_invalid_email(
         self, send_verification_email
@@ -310,11 +432,12 @@ class NewsletterSubscribeViewTest(TestCase):
 
 class NewsletterUnsubscribeViewTest(TestCase):
 
-    def setUp(self):
-        self.verified_subscriber = baker.make(
+    @classmethod
+    def setUpTestData(cls):
+        cls.verified_subscriber = baker.make(
             Subscriber, subscribed=True, verified=True
         )
-        self.unsubscribed_email = baker.make(
+        cls.unsubscribed_email = baker.make(
             Subscriber, subscribed=False, verified=False
         )
 
@@ -393,15 +516,30 @@ class NewsletterUnsubscribeViewTest(TestCase):
             for m in get_messages(response.wsgi_request)
         ][0]
 
-        self.verified_subscriber.refresh_from_db()
-        self.assertFalse(self.verified_subscriber.subscribed)
-        self.assertFalse(self.verified_subscriber.verified)
+        subscriber = Subscriber.objects.get(pk=self.verified_subscriber.pk)
+        self.assertFalse(subscriber.subscribed)
+        self.assertFalse(subscriber.verified)
 
         self.assertIn(
             'You have successfully unsubscribed from the newsletter.',
             message[0]
         )
 
+    def test_newsfeed_unsubscribe_view_success_mixed_case(self):
+        response = self.client.post(
+            reverse('newsfeed:newsletter_unsubscribe'),
+            data={
+                "email_address":
+                    self.verified_subscriber.email_address.upper()
+            },
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        subscriber = Subscriber.objects.get(pk=self.verified_subscriber.pk)
+        self.assertFalse(subscriber.subscribed)
+
     def test_newsfeed_unsubscribe_view_invalid_email(self):
         response = self.client.post(
             reverse('newsfeed:newsletter_unsubscribe'),
@@ -419,9 +557,9 @@ class NewsletterUnsubscribeViewTest(TestCase):
 
         self.assertEqual(response.status_code, 200)
 
-        self.verified_subscriber.refresh_from_db()
-        self.assertFalse(self.verified_subscriber.subscribed)
-        self.assertFalse(self.verified_subscriber.verified)
+        subscriber = Subscriber.objects.get(pk=self.verified_subscriber.pk)
+        self.assertFalse(subscriber.subscribed)
+        self.assertFalse(subscriber.verified)
 
         response_data = json.loads(response.content)
 
@@ -493,22 +631,25 @@ class NewsletterUnsubscribeViewTest(TestCase):
 
 class NewsletterSubscriptionConfirmViewTest(TestCase):
 
-    def setUp(self):
-        self.verified_subscriber = baker.make(
+    @classmethod
+    def setUpTestData(cls):
+        cls.verified_subscriber = baker.make(
             Subscriber, subscribed=True, verified=True
         )
-        self.unverified_subscriber = baker.make(
+        cls.unverified_subscriber = baker.make(
             Subscriber, subscribed=False, verified=False,
             verification_sent_date=timezone.now()
         )
 
     def test_newsfeed_subscribe_view_url_exists(self):
-        response = self.client.get(
-            reverse(
-                'newsfeed:newsletter_subscription_confirm',
-                kwargs={'token': self.unverified_subscriber.token}
+        # one query to fetch the subscriber and one to update it
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse(
+                    'newsfeed:newsletter_subscription_confirm',
+                    kwargs={'token': self.unverified_subscriber.token}
+                )
             )
-        )
 
         self.assertEqual(response.status_code, 200)
         self.assertTrue('subscribed' in response.context)
@@ -525,3 +666,21 @@ class NewsletterSubscriptionConfirmViewTest(TestCase):
             )
         )
         self.assertEqual(response.status_code, 404)
+
+    def test_newsfeed_subscribe_view_with_expired_token(self):
+        expired_subscriber = baker.make(
+            Subscriber, subscribed=False, verified=False,
+            verification_sent_date=timezone.now() - timezone.timedelta(days=3)
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse(
+                    'newsfeed:newsletter_subscription_confirm',
+                    kwargs={'token': expired_subscriber.token}
+                )
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.context['subscribed'])
+        self.assertContains(response, expired_subscriber.email_address)